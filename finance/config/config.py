@@ -2,15 +2,15 @@
 See tests for more examples.
 """
 from __future__ import annotations
+import datetime
 import os
 from os.path import join
 from copy import deepcopy
+import functools
 import logging
-from typing import Union
+import re
+from typing import List, Tuple, Union
 
-import pandas as pd
-
-import finance
 from finance import ROOT_DIR
 from finance.utils.file import read_json
 
@@ -31,33 +31,71 @@ class OverridingError(Exception):
 
 
 __config = None
+__initialised = False
+
+# Sentinel used to distinguish missing keys from keys with a None value.
+_MISSING = object()
+
+_TIMEDELTA_PATTERN = re.compile(r"^(\d+)\s*(s|m|h|d|w)$")
+_TIMEDELTA_UNITS = {"s": "seconds", "m": "minutes", "h": "hours", "d": "days", "w": "weeks"}
 
 
 def get_cache_config(cache_name: str) -> Dict[str, str]:
     """Returns the path to the requests cache."""
+    return dict(_resolve_cache_config(cache_name=cache_name))
+
+
+@functools.lru_cache(maxsize=None)
+def _resolve_cache_config(cache_name: str) -> Dict[str, str]:
+    """Resolve the cache config once per cache name. Must not be mutated.
+
+    A new dictionary is created so that the global config is left untouched.
+    """
 
     config = get_config()
-    cache_config = config["cache"][cache_name]
+    cache_config = dict(config["cache"][cache_name])
 
     if not os.path.isabs(cache_config["path"]):
-        cache_config["path"] = os.path.normpath(os.path.join(finance.ROOT_DIR, cache_config["path"]))
+        cache_config["path"] = os.path.normpath(os.path.join(ROOT_DIR, cache_config["path"]))
     
     if "expire_after" in cache_config and cache_config["expire_after"]:
-        cache_config["expire_after"] = pd.Timedelta(cache_config["expire_after"]).to_pytimedelta()
+        cache_config["expire_after"] = _parse_timedelta(cache_config["expire_after"])
     else:
         cache_config["expire_after"] = None
 
     return cache_config
 
 
+def _parse_timedelta(value: str) -> datetime.timedelta:
+    """Parse a duration such as "30m" or "1d".
+
+    Simple durations are parsed directly, anything else is parsed by pandas.
+    """
+
+    match = _TIMEDELTA_PATTERN.match(value) if isinstance(value, str) else None
+
+    if match is not None:
+        amount, unit = match.groups()
+        return datetime.timedelta(**{_TIMEDELTA_UNITS[unit]: int(amount)})
+
+    # pandas is slow to import and is only needed for the durations that are not simple.
+    import pandas as pd
+
+    return pd.Timedelta(value).to_pytimedelta()
+
+
+@functools.lru_cache(maxsize=1)
 def get_credentials() -> dict:
-    """Retrieve the credentials from the path specified in the credentials file."""
+    """Retrieve the credentials from the path specified in the credentials file.
+
+    The credentials file is only read once, the returned dictionary must not be mutated.
+    """
 
     config = get_config()
     credentials_path = config["credentials_path"]
 
     if not os.path.isabs(credentials_path):
-        credentials_path = os.path.normpath(os.path.join(finance.ROOT_DIR, credentials_path))
+        credentials_path = os.path.normpath(os.path.join(ROOT_DIR, credentials_path))
 
     credentials = read_json(path=credentials_path)
 
@@ -65,24 +103,29 @@ def get_credentials() -> dict:
 
 
 def get_config() -> dict:
-    """This function retrieves the global object detection engine for this module.
+    """This function retrieves the global config for this package.
 
-    This function ensures that the engine is created only when it is needed.
-    If the engine has not yet been created it is created.
+    This function ensures that the config is created only when it is needed.
+    If the config has not yet been created, the base config is used and
+    kept for subsequent calls.
 
     Returns:
-        __config: An object that can be used to create run object detection
+        __config: The package wide configuration dictionary.
     """
 
+    global __config
+
     if __config is None:
-        return read_base_config()
-    else:
-        return __config
+        __config = read_base_config()
+
+    return __config
 
 
 def initialise_config(*configs: Union[str, dict]) -> None:
     """This function initialises a package wide configuration object.
 
+    If get_config was called before, the base config it created is replaced.
+
     Parameters:
         configs: The paths to the configuration files that will be
             merged with the base config. Can also be passed directly as
@@ -90,17 +133,36 @@ def initialise_config(*configs: Union[str, dict]) -> None:
     """
 
     global __config
+    global __initialised
 
-    if __config is None:
+    if not __initialised:
         logger.info("Creating package config.")
         __config = generate_config(*configs)
+        __initialised = True
+        _resolve_cache_config.cache_clear()
+        get_credentials.cache_clear()
     else:
         raise ValueError("The config has already been initialised. It cannot be initialised twice.")
 
 
 def read_base_config() -> dict:
-    """Load the base configuration."""
-    return read_json(join(ROOT_DIR, "config", "base_config.json"))
+    """Load the base configuration.
+
+    The file is only parsed once, a copy is returned so that callers can mutate it.
+    """
+    return deepcopy(_cached_base_config())
+
+
+@functools.lru_cache(maxsize=1)
+def _cached_base_config() -> dict:
+    """Parse the base configuration file. Must not be mutated."""
+    return read_json(join(ROOT_DIR, "config", "base_config.json"), use_cache=True)
+
+
+@functools.lru_cache(maxsize=1)
+def _read_is_non_overridable() -> dict:
+    """Parse the is_non_overridable file. Must not be mutated."""
+    return read_json(join(ROOT_DIR, "config", "is_non_overridable.json"), use_cache=True)
 
 
 def generate_config(*configs: Union[str, dict]) -> dict:
@@ -132,8 +194,9 @@ def generate_config_from_dictionaries(*configs: dict) -> dict:
 
     Instead of using file paths, this function uses dictionaries.
     """
-    base_config = read_base_config()
-    is_non_overridable = read_json(join(ROOT_DIR, "config", "is_non_overridable.json"))
+    # merge_overridable_dictionaries copies the base config so the cached one can be used directly.
+    base_config = _cached_base_config()
+    is_non_overridable = _read_is_non_overridable()
 
     try:
         merged_config = merge_overridable_dictionaries(base_config, *configs, is_non_overridable=is_non_overridable)
@@ -171,16 +234,22 @@ def merge_overridable_dictionaries(
 
     merged_dictionary = deepcopy(base_dictionary)
 
+    # The is_non_overridable dictionary and the non overridable fields of the base do not
+    # change between merges so they only need to be validated once.
+    if is_non_overridable is not None and dictionaries:
+        is_non_overridable_validation(is_non_overridable)
+        overriding_base_dictionary_validation(merged_dictionary, is_non_overridable)
+        non_overridable_paths = _flatten_non_overridable(is_non_overridable)
+
     for dictionary in dictionaries:
 
+        if not dictionary:
+            continue
+
         if is_non_overridable is not None:
-            is_non_overridable_validation(is_non_overridable)
-            overriding_dictionary_validation(dictionary, is_non_overridable)
-            overriding_base_dictionary_validation(merged_dictionary, is_non_overridable)
+            _overriding_paths_validation(dictionary, non_overridable_paths)
 
-        merged_dictionary = merge_dictionaries(
-            merged_dictionary, dictionary, raise_new_keys=raise_new_keys, raise_overriding=raise_overriding
-        )
+        _merge_into(merged_dictionary, dictionary, raise_overriding=raise_overriding, raise_new_keys=raise_new_keys)
 
     return merged_dictionary
 
@@ -218,23 +287,42 @@ def merge_dictionaries(
             and raise_overriding is set to True.
     """
     merged_dictionary = deepcopy(base_dictionary)
+    _merge_into(merged_dictionary, dictionary, raise_overriding=raise_overriding, raise_new_keys=raise_new_keys)
 
-    for key in dictionary.keys():
+    return merged_dictionary
 
-        if key in base_dictionary and isinstance(base_dictionary[key], dict) and isinstance(dictionary[key], dict):
 
-            merged_dictionary[key] = merge_dictionaries(
-                base_dictionary[key], dictionary[key], raise_overriding=raise_overriding, raise_new_keys=raise_new_keys
-            )
+def _merge_into(
+    base_dictionary: dict, dictionary: dict, raise_overriding: bool = False, raise_new_keys: bool = False
+) -> None:
+    """In place version of merge_dictionaries.
+
+    base_dictionary is modified directly and must therefore already be a copy
+    owned by the caller. Values taken from dictionary are copied so that
+    subsequent merges do not modify the caller's dictionaries.
+    """
+
+    if not dictionary:
+        return
+
+    # Config dictionaries are parsed from json so only plain dicts are expected,
+    # which allows the cheaper type check instead of isinstance.
+    base_get = base_dictionary.get
+
+    for key, value in dictionary.items():
+
+        base_value = base_get(key, _MISSING)
+
+        if type(base_value) is dict and type(value) is dict:
+
+            _merge_into(base_value, value, raise_overriding=raise_overriding, raise_new_keys=raise_new_keys)
         else:
-            if key in base_dictionary and raise_overriding:
+            if base_value is not _MISSING and raise_overriding:
                 raise OverridingError(f"Cannot override keys when raise_overriding is True. Trying to override {key}")
-            elif key not in base_dictionary and raise_new_keys:
+            elif base_value is _MISSING and raise_new_keys:
                 raise NewKeyError(f"Cannot add new key when raise_new_keys is True. New key is {key}")
             else:
-                merged_dictionary[key] = dictionary[key]
-
-    return merged_dictionary
+                base_dictionary[key] = deepcopy(value)
 
 
 def is_non_overridable_validation(is_non_overridable: dict) -> None:
@@ -280,21 +368,27 @@ def is_non_overridable_validation(is_non_overridable: dict) -> None:
         is not a valid example (because of the list and False).
     """
 
-    for key, value in is_non_overridable.items():
+    stack = [is_non_overridable]
 
-        if not isinstance(key, str):
-            raise IsNonOverridableError(
-                "All keys of the is_non_overridable " f"dictionary must be strings. Found: {key} of type: {type(key)} "
-            )
+    while stack:
+        node = stack.pop()
 
-        if isinstance(value, dict):
-            return is_non_overridable_validation(is_non_overridable[key])
-        else:
-            if value != True:
+        for key, value in node.items():
+
+            if not isinstance(key, str):
                 raise IsNonOverridableError(
-                    "All values of the is_non_overridable " f"dictionary must be True. Found: {value}"
+                    "All keys of the is_non_overridable "
+                    f"dictionary must be strings. Found: {key} of type: {type(key)} "
                 )
 
+            if isinstance(value, dict):
+                stack.append(value)
+            else:
+                if value != True:
+                    raise IsNonOverridableError(
+                        "All values of the is_non_overridable " f"dictionary must be True. Found: {value}"
+                    )
+
 
 def overriding_dictionary_validation(dictionary: dict, is_non_overridable: dict) -> None:
     """Validate the config dictionary based on the is_non_overridable.
@@ -316,18 +410,59 @@ def overriding_dictionary_validation(dictionary: dict, is_non_overridable: dict)
         None if the dictionary is valid.
     """
 
-    intersection = set(dictionary).intersection(set(is_non_overridable))
+    _overriding_paths_validation(dictionary, _flatten_non_overridable(is_non_overridable))
+
+
+def _overriding_paths_validation(dictionary: dict, non_overridable_paths: List[Tuple[Tuple[str, ...], bool]]) -> None:
+    """See overriding_dictionary_validation.
 
-    for key in intersection:
+    The non overridable fields are given as the key paths returned by _flatten_non_overridable.
+    """
+
+    for path, is_field in non_overridable_paths:
+        node = dictionary
 
-        if is_non_overridable[key] == True:
-            raise IsNonOverridableError(f"Dictionary attempting to override a non overridable field: {key}.")
+        for key in path:
+            if type(node) is not dict:
+                raise IsNonOverridableError("Dictionary and non overridable are not compatible")
 
-        elif isinstance(is_non_overridable[key], dict) and isinstance(dictionary[key], dict):
-            overriding_dictionary_validation(dictionary[key], is_non_overridable[key])
+            node = node.get(key, _MISSING)
 
+            if node is _MISSING:
+                break
         else:
-            raise IsNonOverridableError("Dictionary and non overridable are not compatible")
+            if is_field:
+                raise IsNonOverridableError(
+                    f"Dictionary attempting to override a non overridable field: {'.'.join(path)}."
+                )
+            elif type(node) is not dict:
+                raise IsNonOverridableError("Dictionary and non overridable are not compatible")
+
+
+def _flatten_non_overridable(is_non_overridable: dict) -> List[Tuple[Tuple[str, ...], bool]]:
+    """List the key paths of all the non overridable fields.
+
+    Each path is paired with True if it leads to a non overridable field and with False
+    if it leads to an empty dictionary, whose overriding value must then also be a dictionary.
+
+    Examples:
+        _flatten_non_overridable({'a': True, 'b': {'b1': True}, 'c': {}})
+            = [(('a',), True), (('c',), False), (('b', 'b1'), True)]
+    """
+
+    paths = []
+    stack = [((), is_non_overridable)]
+
+    while stack:
+        prefix, node = stack.pop()
+
+        for key, value in node.items():
+            if isinstance(value, dict) and value:
+                stack.append((prefix + (key,), value))
+            else:
+                paths.append((prefix + (key,), not isinstance(value, dict)))
+
+    return paths
 
 
 def overriding_base_dictionary_validation(base_dictionary: dict, is_non_overridable: dict) -> None:
@@ -350,13 +485,11 @@ def overriding_base_dictionary_validation(base_dictionary: dict, is_non_overrida
         None if the dictionary is valid.
     """
 
-    difference = set(is_non_overridable) - set(base_dictionary)
+    difference = is_non_overridable.keys() - base_dictionary.keys()
 
     if len(difference) != 0:
         raise IsNonOverridableError("The is_non_overridable contains fields " "that are not in the base_dictionary.")
 
-    intersection = set(is_non_overridable).intersection(set(base_dictionary))
-
-    for key in intersection:
+    for key in is_non_overridable:
         if isinstance(is_non_overridable[key], dict) and isinstance(base_dictionary[key], dict):
             overriding_base_dictionary_validation(base_dictionary[key], is_non_overridable[key])
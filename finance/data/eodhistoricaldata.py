@@ -1,9 +1,14 @@
 """Contains useful functions to download ticker and exchange data from eobhistoricaldata.com
 """
 from __future__ import annotations
+import collections
+from concurrent.futures import ThreadPoolExecutor
+import functools
+import types
 import urllib
 
 import pandas as pd
+import requests_cache
 
 from finance.config import config
 from finance.utils import requests_
@@ -11,46 +16,63 @@ from finance.utils import requests_
 NAME = __name__.split(".")[-1]
 BASE_URL = f"https://{NAME}.com"
 
-__session = requests_.create_requests_session_from_cache_name(cache_name=NAME)
+
+@functools.lru_cache(maxsize=1)
+def _get_session() -> requests_cache.CachedSession:
+    """Create the cached session of this module the first time it is needed."""
+    return requests_.create_requests_session_from_cache_name(cache_name=NAME)
+
 
 # The following dictionary is used to filter the tickers after downloading them from EOBHistorical data.
 # The EOBHistoricaldata api has a quirk that only allows to download all US tickers at the same time.
 # They then need to be filtered based on the name of the associated exchange.
-MIC_CODE_TO_EXCHANGE_NAME = {"XNYS": "NYSE", "XNAS": "NASDAQ"}
+MIC_CODE_TO_EXCHANGE_NAME = types.MappingProxyType({"XNYS": "NYSE", "XNAS": "NASDAQ"})
 
 
 def get_exchange_mic_to_code(
-    exchange_mics: Union[List[str], Set[str]], exchanges_df: pd.DataFrame = None
+    exchange_mics: Union[List[str], Set[str]],
+    exchanges_df: pd.DataFrame = None,
+    session: requests_cache.CachedSession = None,
 ) -> Dict[str, Set[str]]:
     """Returns a dictionary that maps exchange codes (used by eodhistoricaldata.com) and the corresponding exchange MICS
 
     Args:
         exchange_mics (Union[List[str], Set[str]]): The MICs of the exchanges.
         exchanges_df (pd.DataFrame): The exchanges dataframe provided by the eobhistoricaldata.com.
+        session (requests_cache.CachedSession, optional): The session used to download the exchanges
+            if exchanges_df is not provided. Defaults to the cached session of this module.
 
     Returns:
         Dict[str, Set[str]]: A mapping between MIC code and exchange codes.
     """
 
-    exchange_mics = set(exchange_mics)
+    exchange_mics = frozenset(exchange_mics)
 
     if exchanges_df is None:
-        exchanges_df = get_exchanges()
+        exchanges_df = get_exchanges(session=session)
 
-    exchanges_df["OperatingMIC"] = exchanges_df["OperatingMIC"].apply(lambda x: set(x.split(", ")) if x else set())
-    exchanges_df = exchanges_df.explode(column="OperatingMIC")
-    exchanges_df_filtered = exchanges_df[exchanges_df["OperatingMIC"].isin(exchange_mics)]
+    # One row per operating MIC. The code is exploded along with it so that the rows
+    # stay aligned even if the index of exchanges_df is not unique.
+    operating_mics = exchanges_df["OperatingMIC"].fillna("").str.split(",").to_numpy()
+    mics_df = exchanges_df[["Code"]].assign(OperatingMIC=operating_mics)
+    mics_df = mics_df.explode(column="OperatingMIC", ignore_index=True)
+    mics_df["OperatingMIC"] = mics_df["OperatingMIC"].str.strip()
+    mics_df = mics_df[mics_df["OperatingMIC"].isin(exchange_mics)]
 
-    exchange_mics_to_code = dict(zip(exchanges_df_filtered["OperatingMIC"], exchanges_df_filtered["Code"]))
+    exchange_mics_to_code = dict(zip(mics_df["OperatingMIC"].to_numpy(), mics_df["Code"].to_numpy()))
 
     return exchange_mics_to_code
 
 
-def get_exchanges() -> pd.DataFrame:
+def get_exchanges(session: requests_cache.CachedSession = None) -> pd.DataFrame:
     """Gets all the names and codes of the exchanges provided by eobhistoricaldata.
 
     In total about 70 exchanges are returned from all over the world (LSE, NYSE, DAX etc...).
 
+    Args:
+        session (requests_cache.CachedSession, optional): The session used to make the request.
+            Defaults to the cached session of this module.
+
     Returns:
         pd.DataFrame: The list of exchanges (the US exchanges are grouped under the "US" code.)
 
@@ -66,25 +88,32 @@ def get_exchanges() -> pd.DataFrame:
     url = urllib.parse.urljoin(base=BASE_URL, url="api/exchanges-list")
     params = {"api_token": credentials[NAME]["api_key"], "fmt": "json"}
 
-    output = __session.get(url=url, params=params)
+    session = session or _get_session()
+    output = session.get(url=url, params=params)
 
     exchanges = pd.DataFrame(output.json())
 
     return exchanges
 
 
-def get_tickers(exchange_code: str) -> pd.DataFrame:
+def get_tickers(exchange_code: str, session: requests_cache.CachedSession = None) -> pd.DataFrame:
     """Get the ticker symbols from a given echange.
 
     The possible exchanges are provided by the "Code" column of the dataframe returned
     by get_exchanges
+
+    Args:
+        exchange_code (str): The code of the exchange.
+        session (requests_cache.CachedSession, optional): The session used to make the request.
+            Defaults to the cached session of this module.
     """
     credentials = config.get_credentials()
 
     url = urllib.parse.urljoin(base=BASE_URL, url=f"api/exchange-symbol-list/{exchange_code}")
     params = {"api_token": credentials[NAME]["api_key"], "fmt": "json"}
 
-    output = __session.get(url=url, params=params)
+    session = session or _get_session()
+    output = session.get(url=url, params=params)
 
     tickers_df = pd.DataFrame(output.json())
 
@@ -94,9 +123,13 @@ def get_tickers(exchange_code: str) -> pd.DataFrame:
 def get_tickers_from_exchange_mics(
     exchange_mics: Union[List[str], Set[str]],
     exchanges_df: pd.DataFrame = None,
+    max_workers: int = 8,
+    session: requests_cache.CachedSession = None,
 ) -> pd.DataFrame:
     """Get all the tickers from the provided exchanges.
 
+    The tickers of each exchange are downloaded in parallel threads.
+
     Args:
         exchange_mics (Union[List[str], Set[str]]): The MIC codes of the exchanges.
         exchanges_df (pd.DataFrame, optional): A dataframe containing the exchange codes (result of get_exchanges).
@@ -104,30 +137,49 @@ def get_tickers_from_exchange_mics(
         usa_exchange_filters (Set[str]): If provided, filter all tickers retrieved from 'US' code to only
             return those from the provided exchanges. This is necessary because eobhistoricaldata does not
             allow one to filter on
+        max_workers (int, optional): The maximum number of exchanges downloaded at the same time. Defaults to 8.
+        session (requests_cache.CachedSession, optional): The session used to make the requests.
+            Its connection pool should allow max_workers connections. Defaults to the cached session of this module.
 
     Returns:
         pd.DataFrame: A DataFrame containing the tickers and their data.
     """
 
-    exchange_mic_to_code = get_exchange_mic_to_code(exchange_mics=exchange_mics, exchanges_df=exchanges_df)
+    # The session is created before the worker threads start so that they all share it.
+    session = session or _get_session()
+
+    exchange_mic_to_code = get_exchange_mic_to_code(
+        exchange_mics=exchange_mics, exchanges_df=exchanges_df, session=session
+    )
+
+    # Several MICs can share the same code (e.g. all US exchanges), each code is only downloaded once.
+    exchange_code_counts = collections.Counter(exchange_mic_to_code.values())
+    exchange_codes = list(exchange_code_counts)
+
+    download_tickers = functools.partial(get_tickers, session=session)
+    max_workers = max(1, min(max_workers, len(exchange_codes)))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        code_to_tickers_df = dict(zip(exchange_codes, executor.map(download_tickers, exchange_codes)))
 
     tickers_dfs = []
     for exchange_mic, exchange_code in exchange_mic_to_code.items():
 
-        tickers_df = get_tickers(exchange_code=exchange_code)
+        tickers_df = code_to_tickers_df[exchange_code]
 
         if exchange_mic in MIC_CODE_TO_EXCHANGE_NAME:
             tickers_df = tickers_df.loc[tickers_df["Exchange"] == MIC_CODE_TO_EXCHANGE_NAME[exchange_mic]]
+        elif exchange_code_counts[exchange_code] > 1:
+            tickers_df = tickers_df.copy()
 
         if len(tickers_df) == 0:
             raise ValueError(
                 "Could not find any tickers for exchange mic: {exchange_mic} and exchange code: {exchange_code}"
             )
 
-        tickers_df["MIC"] = [exchange_mic for _ in range(len(tickers_df))]
-        tickers_df["Eodhistoricaldata Code"] = [exchange_code for _ in range(len(tickers_df))]
+        tickers_df["MIC"] = exchange_mic
+        tickers_df["Eodhistoricaldata Code"] = exchange_code
         tickers_dfs.append(tickers_df)
 
-    tickers_df = pd.concat(tickers_dfs, axis=0)
+    tickers_df = pd.concat(tickers_dfs, axis=0, copy=False, ignore_index=True)
 
     return tickers_df
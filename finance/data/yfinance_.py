@@ -1,37 +1,80 @@
 """Contains useful functions for generating a yfinance dataset."""
 from __future__ import annotations
+import collections
+import functools
 
+import requests_cache
 import yfinance
 
 from finance.utils import requests_
 
 NAME = "yfinance"
 
-__session = requests_.create_requests_session_from_cache_name(cache_name=NAME)
 
+@functools.lru_cache(maxsize=1)
+def _get_session() -> requests_cache.CachedSession:
+    """Create the cached session of this module the first time it is needed."""
+    return requests_.create_requests_session_from_cache_name(cache_name=NAME)
 
-def get_ticker_obj(ticker: str) -> yfinance.Ticker:
+
+# In memory cache of the histories downloaded with the module session, most recently used last.
+_OHLC_HISTORY_CACHE_SIZE = 512
+_ohlc_history_cache = collections.OrderedDict()
+
+
+def clear_cache() -> None:
+    """Clear the in memory cache of ticker objects and histories.
+
+    The in memory cache does not follow the expire_after setting of the requests cache,
+    this function can be used to force the histories to be read again from the session.
+    """
+    _get_cached_ticker_obj.cache_clear()
+    _ohlc_history_cache.clear()
+
+
+def get_ticker_obj(ticker: str, session: requests_cache.CachedSession = None) -> yfinance.Ticker:
     """Gets a yfinance ticker object.
 
+    When no session is provided, the ticker objects are kept in memory (see clear_cache)
+    so the same object is returned for a given ticker.
+
     Args:
         ticker (str): The stock ticker to retrieve.
+        session (requests_cache.CachedSession, optional): The session used by the ticker object.
+            Defaults to the cached session of this module.
 
     Returns:
         yfinance.Ticker: The yfinance ticker object.
     """
 
-    ticker = yfinance.Ticker(ticker, session=__session)
+    if session is None:
+        return _get_cached_ticker_obj(ticker)
+
+    ticker = yfinance.Ticker(ticker, session=session)
 
     return ticker
 
 
-def get_maximum_daily_ohlc_history_from_ticker(ticker: str) -> pd.DataFrame:
+@functools.lru_cache(maxsize=1024)
+def _get_cached_ticker_obj(ticker: str) -> yfinance.Ticker:
+    """Cached version of get_ticker_obj using the module session."""
+    return yfinance.Ticker(ticker, session=_get_session())
+
+
+def get_maximum_daily_ohlc_history_from_ticker(
+    ticker: str, session: requests_cache.CachedSession = None
+) -> pd.DataFrame:
     """Gets the maximum available history for a given ticker.
 
-    The use of the session object enables caching.
+    The use of the session object enables caching. When no session is provided, non empty
+    histories are also kept in memory for the lifetime of the process, regardless of the
+    expire_after setting of the session (see clear_cache). A copy is returned so that it can
+    be modified safely.
 
     Args:
         ticker (str): The stock ticker to retrieve.
+        session (requests_cache.CachedSession, optional): The session used to make the requests.
+            Defaults to the cached session of this module.
 
     Returns:
         pd.DataFrame: A Dataframe containing the OHLC (Open, High, Low, Close) data for a given stock.
@@ -46,7 +89,19 @@ def get_maximum_daily_ohlc_history_from_ticker(ticker: str) -> pd.DataFrame:
         1962-01-08	1.552065	1.552065	1.493274	1.505032	93883	0.0	        0.0
     """
 
-    ticker_obj = get_ticker_obj(ticker=ticker)
-    ohlc_history = ticker_obj.history(period="max")
+    if session is not None:
+        return get_ticker_obj(ticker=ticker, session=session).history(period="max")
+
+    if ticker in _ohlc_history_cache:
+        _ohlc_history_cache.move_to_end(ticker)
+        return _ohlc_history_cache[ticker].copy()
+
+    ohlc_history = get_ticker_obj(ticker=ticker).history(period="max")
+
+    # yfinance returns an empty dataframe when the download fails, it must be retried next time.
+    if len(ohlc_history) > 0:
+        _ohlc_history_cache[ticker] = ohlc_history.copy()
+        if len(_ohlc_history_cache) > _OHLC_HISTORY_CACHE_SIZE:
+            _ohlc_history_cache.popitem(last=False)
 
     return ohlc_history
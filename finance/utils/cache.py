@@ -13,8 +13,9 @@ def get_response_objects_from_cache(cache_name: str) -> Generator[requests_cache
         cache_name (str): One of the keys in the cache section of base_config.json
 
     Returns:
-        Generator[requests_cache.CachedResponse]: A list of the cached responses.
+        Generator[requests_cache.CachedResponse]: The cached responses. Each response is only
+            deserialised when the generator reaches it, responses that cannot be deserialised are skipped.
     """
 
     session = create_requests_session_from_cache_name(cache_name=cache_name)
-    return session.cache.values()
+    yield from session.cache.values()
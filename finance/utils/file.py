@@ -1,6 +1,8 @@
 import errno
 import os
 import json
+import pickle
+import tempfile
 from typing import Union
 from pathlib import Path
 
@@ -18,11 +20,57 @@ def make_dir(directory: Union[str, Path]) -> None:
             raise
 
 
-def read_json(path: Union[str, Path]) -> dict:
-    """Read a json file and return a dictionary."""
-    with open(path, "r") as file:
-        config = json.load(file)
-    return config
+def read_json(path: Union[str, Path], use_cache: bool = False) -> dict:
+    """Read a json file and return a dictionary.
+
+    Args:
+        path (str or Path): Path to the json file.
+        use_cache (bool): If True and the FINANCE_JSON_CACHE environment variable is set to 1,
+            the parsed object is also saved in a pickle file next to the json file (with a .cache.pkl suffix).
+            This pickle file is read instead of the json file as long as it is more recent.
+            Must not be used for files containing secrets. Defaults to False.
+    """
+    path = Path(path)
+
+    if not use_cache or os.environ.get("FINANCE_JSON_CACHE") != "1":
+        return json.loads(path.read_bytes())
+
+    cache_path = Path(f"{path}.cache.pkl")
+
+    try:
+        if cache_path.stat().st_mtime >= path.stat().st_mtime:
+            with open(cache_path, "rb") as file:
+                return pickle.load(file)
+    except (EOFError, pickle.UnpicklingError, OSError):
+        # Missing or unreadable cache, the json file is parsed instead.
+        pass
+
+    obj = json.loads(path.read_bytes())
+    _save_pickle_atomically(obj, cache_path)
+
+    return obj
+
+
+def _save_pickle_atomically(obj: object, output_file: Path) -> None:
+    """Pickle an object to a temporary file and move it in place.
+
+    Readers never see a partially written file. Errors are ignored since the
+    pickle is only used as a cache.
+    """
+    try:
+        file_descriptor, temporary_path = tempfile.mkstemp(dir=output_file.parent, prefix=f"{output_file.name}.")
+    except OSError:
+        return
+
+    try:
+        with os.fdopen(file_descriptor, "wb") as file:
+            pickle.dump(obj, file, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temporary_path, output_file)
+    except OSError:
+        try:
+            os.remove(temporary_path)
+        except OSError:
+            pass
 
 
 def save_json(obj: Union[dict, list], output_file: Union[str, Path], apply_json_formatting: bool = True) -> None:
@@ -31,9 +79,9 @@ def save_json(obj: Union[dict, list], output_file: Union[str, Path], apply_json_
     Args:
         obj (dict or list): An json serialisable object.
         output_file (str or Path): A path to the json file that will be created.
-        apply_json_formatting (bool): If True, the output json file will
-           contain less white space. This is done using the format_json_string function.
+        apply_json_formatting (bool): If True, the output json file is indented
+           with 4 spaces. If False, it is written on a single line.
            Defaults to True.
     """
     with open(output_file, "w") as file:
-        json.dump(obj, file, indent=4)
+        file.write(json.dumps(obj, indent=4 if apply_json_formatting else None))
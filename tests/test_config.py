@@ -0,0 +1,16 @@
+import pytest
+
+from finance.config.config import IsNonOverridableError, is_non_overridable_validation
+
+
+def test_is_non_overridable_validation_valid():
+    is_non_overridable = {"a": {"x": True, "y": {"z": True}}, "b": True}
+
+    assert is_non_overridable_validation(is_non_overridable) is None
+
+
+def test_is_non_overridable_validation_checks_keys_after_nested_dictionary():
+    is_non_overridable = {"a": {"x": True}, "b": False}
+
+    with pytest.raises(IsNonOverridableError):
+        is_non_overridable_validation(is_non_overridable)